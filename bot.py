@@ -1,25 +1,28 @@
 from discord.ext import commands
 from mistralai import Mistral
 from dotenv import load_dotenv
-from datetime import datetime
 from typing import List, Tuple, Optional, Dict
 import discord
 import logging
-import json
+import logging.handlers
 import os
+import queue
+import time
 import asyncio
 from dataclasses import dataclass
-import sqlite3
+from collections import OrderedDict
+import aiosqlite
 from pathlib import Path
 
-@dataclass
+@dataclass(slots=True)
 class ModerationResult:
     """Classe pour représenter le résultat d'une modération"""
     violations: List[Tuple[str, float]]
+    category_summary: str
     response_id: str
     latency: float
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """Classe pour stocker la configuration du bot"""
     discord_token: str
@@ -58,52 +61,187 @@ class ConfigDB:
     def __init__(self, db_path: str = "bot_config.db"):
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
-        self._init_db()
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn_lock = asyncio.Lock()
+        self._cache: Dict[int, Tuple[Optional[int], Optional[int]]] = {}
+        self._cache_locks: Dict[int, asyncio.Lock] = {}
 
-    def _init_db(self) -> None:
-        """Initialise la base de données"""
-        self.logger.info(f"Initializing database at {self.db_path}")
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
+    async def _init_db(self) -> aiosqlite.Connection:
+        """Ouvre la connexion persistante et initialise la base de données"""
+        async with self._conn_lock:
+            if self._conn is not None:
+                return self._conn
+            self.logger.info("Initializing database at %s", self.db_path)
+            conn = await aiosqlite.connect(self.db_path)
+            await conn.execute('PRAGMA journal_mode=WAL')
+            await conn.execute('PRAGMA synchronous=NORMAL')
+            await conn.execute('PRAGMA temp_store=MEMORY')
+            await conn.execute('PRAGMA cache_size=-64000')
+            await conn.execute('''
                 CREATE TABLE IF NOT EXISTS server_config (
                     guild_id INTEGER PRIMARY KEY,
                     mod_role_id INTEGER,
                     mod_channel_id INTEGER
                 )
             ''')
+            await conn.commit()
+            self._conn = conn
             self.logger.info("Database initialization complete")
+            return conn
+
+    async def close(self) -> None:
+        """Ferme la connexion persistante"""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            self.logger.info("Database connection closed")
 
     async def get_config(self, guild_id: int) -> Tuple[Optional[int], Optional[int]]:
-        """Récupère la configuration d'un serveur"""
-        def _get():
-            with sqlite3.connect(self.db_path) as conn:
-                self.logger.info(f"Fetching config for guild {guild_id}")
-                cursor = conn.execute(
-                    'SELECT mod_role_id, mod_channel_id FROM server_config WHERE guild_id = ?',
-                    (guild_id,)
-                )
-                result = cursor.fetchone()
-                self.logger.info(f"Loaded config for guild {guild_id}")
-                return result if result else (None, None)
-                
-        return await asyncio.to_thread(_get)
+        """Récupère la configuration d'un serveur (avec cache en mémoire)"""
+        cached = self._cache.get(guild_id)
+        if cached is not None:
+            return cached
+
+        conn = self._conn or await self._init_db()
+        lock = self._cache_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            # Un autre appel a pu remplir le cache pendant l'attente du verrou
+            cached = self._cache.get(guild_id)
+            if cached is not None:
+                return cached
+            self.logger.debug("Fetching config for guild %s", guild_id)
+            async with conn.execute(
+                'SELECT mod_role_id, mod_channel_id FROM server_config WHERE guild_id = ?',
+                (guild_id,)
+            ) as cursor:
+                result = await cursor.fetchone()
+            self.logger.debug("Loaded config for guild %s", guild_id)
+            result = tuple(result) if result else (None, None)
+            self._cache[guild_id] = result
+            return result
 
-    async def set_config(self, guild_id: int, mod_role_id: Optional[int] = None, 
+    async def preload_cache(self) -> None:
+        """Pré-charge le cache avec toutes les configurations connues"""
+        conn = self._conn or await self._init_db()
+        async with conn.execute(
+            'SELECT guild_id, mod_role_id, mod_channel_id FROM server_config'
+        ) as cursor:
+            rows = await cursor.fetchall()
+        for guild_id, mod_role_id, mod_channel_id in rows:
+            self._cache[guild_id] = (mod_role_id, mod_channel_id)
+        self.logger.info("Preloaded config cache for %d guilds", len(rows))
+
+    async def set_config(self, guild_id: int, mod_role_id: Optional[int] = None,
                         mod_channel_id: Optional[int] = None) -> None:
         """Met à jour la configuration d'un serveur"""
-        def _set():
-            with sqlite3.connect(self.db_path) as conn:
-                self.logger.info(f"Updating config for guild {guild_id}")
-                conn.execute('''
-                    INSERT INTO server_config (guild_id, mod_role_id, mod_channel_id)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(guild_id) DO UPDATE SET
-                        mod_role_id = COALESCE(?, mod_role_id),
-                        mod_channel_id = COALESCE(?, mod_channel_id)
-                ''', (guild_id, mod_role_id, mod_channel_id, mod_role_id, mod_channel_id))
-                self.logger.info(f"Updated config for guild {guild_id}")
-
-        await asyncio.to_thread(_set)
+        if mod_role_id is None and mod_channel_id is None:
+            self.logger.debug("No config values to update for guild %s", guild_id)
+            return
+        conn = self._conn or await self._init_db()
+        self.logger.info("Updating config for guild %s", guild_id)
+        if mod_role_id is not None:
+            await conn.execute('''
+                INSERT INTO server_config (guild_id, mod_role_id)
+                VALUES (?, ?)
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    mod_role_id = excluded.mod_role_id
+            ''', (guild_id, mod_role_id))
+        if mod_channel_id is not None:
+            await conn.execute('''
+                INSERT INTO server_config (guild_id, mod_channel_id)
+                VALUES (?, ?)
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    mod_channel_id = excluded.mod_channel_id
+            ''', (guild_id, mod_channel_id))
+        await conn.commit()
+        async with conn.execute(
+            'SELECT mod_role_id, mod_channel_id FROM server_config WHERE guild_id = ?',
+            (guild_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        self._cache[guild_id] = tuple(row)
+        self.logger.info("Updated config for guild %s", guild_id)
+
+class ModerationBatcher:
+    """Regroupe les appels de modération en lots pour réduire le nombre de requêtes API"""
+    def __init__(self, mistral_client: Mistral, model: str = "mistral-moderation-latest",
+                 max_batch_size: int = 32, max_wait: float = 0.05):
+        self.mistral_client = mistral_client
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.logger = logging.getLogger(__name__)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        # Borne le nombre de lots simultanément en vol vers l'API
+        self._semaphore = asyncio.Semaphore(int(os.getenv("MISTRAL_MAX_CONCURRENCY", "8")))
+        self._batch_tasks: set = set()
+
+    async def submit(self, content: str):
+        """Soumet un contenu à modérer et attend son résultat de classification"""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._worker())
+        future = loop.create_future()
+        await self._queue.put((content, future))
+        return await future
+
+    async def close(self) -> None:
+        """Arrête la tâche de fond du batcher"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _worker(self) -> None:
+        """Draine la file par lots et lance chaque lot en tâche bornée"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = loop.create_task(self._moderate_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _moderate_batch(self, batch: list) -> None:
+        """Modère un lot et distribue les résultats aux futures"""
+        async with self._semaphore:
+            self.logger.debug("Moderating batch of %d messages", len(batch))
+            try:
+                response = await self.mistral_client.classifiers.moderate_async(
+                    model=self.model,
+                    inputs=[content for content, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        results = response.results
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result((response.id, result))
+
+        # Si l'API renvoie moins de résultats que d'entrées, ne jamais
+        # laisser une future en suspens : chaque submit bloqué retiendrait
+        # un slot de modération indéfiniment
+        if len(results) < len(batch):
+            self.logger.error(
+                "Moderation API returned %d results for %d inputs", len(results), len(batch)
+            )
+            error = RuntimeError("moderation API returned fewer results than inputs")
+            for _, future in batch[len(results):]:
+                if not future.done():
+                    future.set_exception(error)
 
 CATEGORY_DESCRIPTIONS = {
     "sexual": "Contenu à caractère sexuel",
@@ -117,6 +255,39 @@ CATEGORY_DESCRIPTIONS = {
     "pii": "Divulgation d'informations personnelles",
 }
 
+# Gabarits "description: score%" précompilés par catégorie
+_CAT_FMT = {category: f"{desc}: %.1f%%" for category, desc in CATEGORY_DESCRIPTIONS.items()}
+
+# Longueur minimale d'un message pour justifier un appel de modération
+MIN_MODERATION_LENGTH = 3
+# Nombre maximal de messages "propres" mémorisés
+CLEAN_CACHE_SIZE = 4096
+
+# Préfixes du message de notification envoyé dans le salon de modération
+_MOD_MENTION_FMT = "<@&%d>"
+_NO_MOD_ROLE_WARNING = "⚠️ Aucun role de modérateur n'a été défini !"
+
+_MOD_THUMBNAIL_URL = "https://cdn3.emoji.gg/emojis/2731-certified-moderator.png"
+
+_VIOLATION_NOTICE = (
+    ", votre message a été supprimé et signalé aux "
+    "modérateurs car il a été considéré comme offensant par le système "
+    "d'auto modération. Si vous pensez qu'il s'agit d'une erreur, veuillez "
+    "contacter un modérateur et lui fournir l'ID de la violation ci-dessous."
+)
+
+_VIOLATION_EMBED_TEMPLATE = {
+    "title": "🚨 Automodération",
+    "color": discord.Color.red().value,
+    "thumbnail": {"url": _MOD_THUMBNAIL_URL},
+}
+
+_VIOLATION_REPORT_TEMPLATE = {
+    "title": "🚨 Violation détectée",
+    "color": discord.Color.red().value,
+    "thumbnail": {"url": _MOD_THUMBNAIL_URL},
+}
+
 class ModBot(commands.Bot):
     """Classe personnalisée pour le bot de modération"""
     def __init__(self):
@@ -126,22 +297,48 @@ class ModBot(commands.Bot):
         super().__init__(command_prefix='!', intents=intents)
         
         self.config = BotConfig.from_env()
-        self.mistral_client = Mistral(self.config.mistral_api_key)
+        # Valeurs par défaut figées sur l'instance pour le chemin chaud
+        self._default_role = self.config.default_mod_role_id
+        self._default_channel = self.config.default_mod_channel_id
+        self.mistral_client = Mistral(api_key=self.config.mistral_api_key)
+        self.batcher = ModerationBatcher(self.mistral_client)
         self.db = ConfigDB()
         self.uptime = None
+        self._clean_cache: OrderedDict = OrderedDict()
+        self._channel_cache: Dict[int, discord.abc.GuildChannel] = {}
+        self._role_cache: Dict[Tuple[int, int], discord.Role] = {}
+        self._moderation_tasks: set = set()
+        self._moderation_limit = asyncio.Semaphore(
+            int(os.getenv("MAX_CONCURRENT_MODERATIONS", "16"))
+        )
         self._setup_logging()
         self._setup_commands()
 
+    async def close(self) -> None:
+        """Ferme proprement le bot et ses ressources"""
+        await self.batcher.close()
+        await self.db.close()
+        await super().close()
+        self._log_listener.stop()
+
     def _setup_logging(self) -> None:
-        """Configure le système de logging"""
+        """Configure le système de logging (écriture hors de la boucle d'événements)"""
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+        file_handler = logging.FileHandler("bot.log")
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        # Les handlers bloquants tournent sur un thread dédié via QueueListener
+        log_queue: queue.Queue = queue.Queue(-1)
         logging.basicConfig(
             level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[
-                logging.FileHandler("bot.log"),
-                logging.StreamHandler()
-            ]
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler
+        )
+        self._log_listener.start()
         self.logger = logging.getLogger(__name__)
         self.logger.info("Logging system initialized")
 
@@ -151,7 +348,7 @@ class ModBot(commands.Bot):
         @commands.has_permissions(administrator=True)
         async def set_mod_role(ctx: commands.Context, role: discord.Role):
             """Configure le rôle de modérateur pour le serveur"""
-            self.logger.info(f"Setting mod role for guild {ctx.guild.id}: {role.id}")
+            self.logger.info("Setting mod role for guild %s: %s", ctx.guild.id, role.id)
             await self.db.set_config(ctx.guild.id, mod_role_id=role.id)
             await ctx.send(f"✅ Rôle de modérateur configuré: {role.mention}")
 
@@ -159,7 +356,7 @@ class ModBot(commands.Bot):
         @commands.has_permissions(administrator=True)
         async def set_mod_channel(ctx: commands.Context, channel: discord.TextChannel):
             """Configure le salon de modération pour le serveur"""
-            self.logger.info(f"Setting mod channel for guild {ctx.guild.id}: {channel.id}")
+            self.logger.info("Setting mod channel for guild %s: %s", ctx.guild.id, channel.id)
             await self.db.set_config(ctx.guild.id, mod_channel_id=channel.id)
             await ctx.send(f"✅ Salon de modération configuré: {channel.mention}")
 
@@ -168,15 +365,15 @@ class ModBot(commands.Bot):
         async def show_config(ctx: commands.Context):
             """Affiche la configuration actuelle du serveur"""
             mod_role_id, mod_channel_id = await self.db.get_config(ctx.guild.id)
-            self.logger.info(f"Showing config for guild {ctx.guild.id}")
+            self.logger.info("Showing config for guild %s", ctx.guild.id)
             
             embed = discord.Embed(
                 title="Configuration du serveur",
                 color=discord.Color.blue()
             )
             
-            mod_role = ctx.guild.get_role(mod_role_id) if mod_role_id else None
-            mod_channel = ctx.guild.get_channel(mod_channel_id) if mod_channel_id else None
+            mod_role = self.get_cached_role(ctx.guild, mod_role_id) if mod_role_id else None
+            mod_channel = self.get_cached_channel(mod_channel_id) if mod_channel_id else None
             
             embed.add_field(
                 name="Rôle de modérateur",
@@ -203,133 +400,191 @@ class ModBot(commands.Bot):
                 self.logger.warning("Missing argument in command")
             else:
                 await ctx.send("❌ Une erreur est survenue lors de l'exécution de la commande.")
-                self.logger.error(f"Command error: {error}")
+                self.logger.error("Command error: %s", error)
+
+    def get_cached_channel(self, channel_id: int) -> Optional[discord.abc.GuildChannel]:
+        """Récupère un salon via le cache local, avec repli sur get_channel"""
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.get_channel(channel_id)
+            if channel is not None:
+                self._channel_cache[channel_id] = channel
+        return channel
+
+    def get_cached_role(self, guild: discord.Guild, role_id: int) -> Optional[discord.Role]:
+        """Récupère un rôle via le cache local, avec repli sur guild.get_role"""
+        key = (guild.id, role_id)
+        role = self._role_cache.get(key)
+        if role is None:
+            role = guild.get_role(role_id)
+            if role is not None:
+                self._role_cache[key] = role
+        return role
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._channel_cache.pop(channel.id, None)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel,
+                                      after: discord.abc.GuildChannel) -> None:
+        self._channel_cache.pop(before.id, None)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self._role_cache.pop((role.guild.id, role.id), None)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        self._role_cache.pop((before.guild.id, before.id), None)
 
     async def get_server_config(self, guild_id: int) -> Tuple[Optional[int], Optional[int]]:
         """Récupère la configuration d'un serveur avec fallback sur les valeurs par défaut"""
         mod_role_id, mod_channel_id = await self.db.get_config(guild_id)
         return (
-            mod_role_id or self.config.default_mod_role_id,
-            mod_channel_id or self.config.default_mod_channel_id
+            mod_role_id or self._default_role,
+            mod_channel_id or self._default_channel
         )
 
-    async def check_message(self, message: discord.Message) -> Optional[ModerationResult]:
-        """Vérifie un message pour détecter du contenu inapproprié"""
-        try:
-            self.logger.info(f"Moderating message from {message.author} ({message.author.id})")
-            start_time = datetime.now()
-            response = await asyncio.to_thread(
-                self.mistral_client.classifiers.moderate,
-                model="mistral-moderation-latest",
-                inputs=[message.content]
-            )
-            latency = ((datetime.now() - start_time).total_seconds())/1000
-            self.logger.info(f"Moderation response received in {latency} milliseconds")
-
-            violations = []
-            for result in response.results:
-                for category, is_violation in result.categories.items():
-                    if is_violation:
-                        violations.append((category, result.category_scores[category]))
-
-            if violations:
-                return ModerationResult(
-                    violations=violations,
-                    response_id=response.id,
-                    latency=latency
-                )
-            return None
+    def should_moderate(self, message: discord.Message) -> bool:
+        """Détermine si un message vaut un appel à l'API de modération"""
+        if message.author.bot:
+            return False
+        content = message.content
+        if not content or len(content) < MIN_MODERATION_LENGTH:
+            return False
+        if content.startswith(self.command_prefix):
+            return False
+        if content in self._clean_cache:
+            self._clean_cache.move_to_end(content)
+            return False
+        return True
+
+    def remember_clean(self, content: str) -> None:
+        """Mémorise un contenu jugé propre pour éviter de le re-modérer"""
+        self._clean_cache[content] = None
+        self._clean_cache.move_to_end(content)
+        if len(self._clean_cache) > CLEAN_CACHE_SIZE:
+            self._clean_cache.popitem(last=False)
 
+    def dispatch_moderation(self, message: discord.Message) -> None:
+        """Lance la modération d'un message en tâche de fond"""
+        task = asyncio.create_task(self._moderate_and_handle(message))
+        self._moderation_tasks.add(task)
+        task.add_done_callback(self._moderation_tasks.discard)
+
+    async def _moderate_and_handle(self, message: discord.Message) -> None:
+        """Modère un message et traite une éventuelle violation"""
+        try:
+            async with self._moderation_limit:
+                result = await self.check_message(message)
         except Exception as e:
-            self.logger.error(f"Error during message moderation: {e}")
-            return None
+            # Échec de l'API : on laisse passer ce message sans mémoriser de verdict
+            self.logger.error("Error during message moderation: %s", e)
+            return
+        if result:
+            await self.handle_violation(message, result)
+        else:
+            self.remember_clean(message.content)
+
+    async def check_message(self, message: discord.Message) -> Optional[ModerationResult]:
+        """Vérifie un message pour détecter du contenu inapproprié
+
+        Propage les erreurs de l'API : un retour None signifie toujours
+        qu'une classification a eu lieu et n'a rien détecté.
+        """
+        self.logger.debug("Moderating message from %s (%s)", message.author, message.author.id)
+        start_time = time.perf_counter()
+        response_id, result = await self.batcher.submit(message.content)
+        latency = time.perf_counter() - start_time
+        self.logger.debug("Moderation response received in %.3f seconds", latency)
+
+        scores = result.category_scores
+        violations = [
+            (category, scores[category])
+            for category, is_violation in result.categories.items() if is_violation
+        ]
+
+        if violations:
+            return ModerationResult(
+                violations=violations,
+                category_summary="\n".join(
+                    _CAT_FMT.setdefault(category, f"{category}: %.1f%%") % (score * 100)
+                    for category, score in violations
+                ),
+                response_id=response_id,
+                latency=latency
+            )
+        return None
 
     async def handle_violation(self, message: discord.Message, result: ModerationResult) -> None:
         """Gère une violation détectée"""
         try:
-            self.logger.info(f"Handling violation for message {message.id}")
-            await message.delete()
-            self.logger.info(f"Message {message.id} deleted")
-            
-            # Créer l'embed pour l'utilisateur
-            embed = self._create_violation_embed(message, result)
-            self.logger.info(f"Sending violation embed to {message.author}")
-            await message.channel.send(embed=embed)
-            
+            self.logger.info("Handling violation for message %s", message.id)
+
             # Récupérer la configuration du serveur
-            self.logger.info(f"Fetching server config for guild {message.guild.id}")
+            self.logger.debug("Fetching server config for guild %s", message.guild.id)
             mod_role_id, mod_channel_id = await self.get_server_config(message.guild.id)
-            
+
+            # Préparer les embeds avant de lancer les appels Discord
+            embed = self._create_violation_embed(message, result)
+            actions = [message.delete(), message.channel.send(embed=embed)]
+
             # Notifier les modérateurs
             if mod_channel_id:
-                mod_channel = self.get_channel(mod_channel_id)
+                mod_channel = self.get_cached_channel(mod_channel_id)
                 if mod_channel:
                     violation_report = self._create_violation_report(message, result)
-                    await mod_channel.send(f"<@&{mod_role_id}>" if mod_role_id else "⚠️ Aucun role de modérateur n'a été défini !", embed=violation_report)
-                    self.logger.info(f"Violation report sent to mod channel {mod_channel_id}")
+                    actions.append(mod_channel.send(
+                        _MOD_MENTION_FMT % mod_role_id if mod_role_id else _NO_MOD_ROLE_WARNING,
+                        embed=violation_report
+                    ))
                 else:
-                    self.logger.error(f"Mod channel {mod_channel_id} not found")
-            
+                    self.logger.error("Mod channel %s not found", mod_channel_id)
+
+            # Les trois appels REST sont indépendants : les exécuter en parallèle
+            outcomes = await asyncio.gather(*actions, return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    self.logger.error("Error handling violation: %s", outcome)
+
             self.logger.info(
-                f"Message from {message.author} ({message.author.id}) deleted and reported for violation: {result.violations}"
+                "Message from %s (%s) deleted and reported for violation: %s",
+                message.author, message.author.id, result.violations
             )
-        
+
         except Exception as e:
-            self.logger.error(f"Error handling violation: {e}")
+            self.logger.error("Error handling violation: %s", e)
 
     def _create_violation_embed(self, message: discord.Message, result: ModerationResult) -> discord.Embed:
         """Crée l'embed de violation pour l'utilisateur"""
-        category_field_value = "\n".join([
-            f"{CATEGORY_DESCRIPTIONS.get(category, category)}: {round(score, 3)*100}%" 
-            for category, score in result.violations
-        ])
-        self.logger.info(f"Violation embed created for {message.author} ({message.author.id})")
-        
-        return discord.Embed(
-            title="🚨 Automodération",
-            description=(
-                f"{message.author.mention}, votre message a été supprimé et signalé aux "
-                "modérateurs car il a été considéré comme offensant par le système "
-                "d'auto modération. Si vous pensez qu'il s'agit d'une erreur, veuillez "
-                "contacter un modérateur et lui fournir l'ID de la violation ci-dessous."
-            ),
-            color=discord.Color.red()
-        ).add_field(name="Catégories", value=category_field_value
-        ).add_field(name="ID", value=result.response_id
-        ).set_thumbnail(url="https://cdn3.emoji.gg/emojis/2731-certified-moderator.png")
+        self.logger.debug("Violation embed created for %s (%s)", message.author, message.author.id)
+
+        embed = discord.Embed.from_dict(_VIOLATION_EMBED_TEMPLATE.copy())
+        embed.description = message.author.mention + _VIOLATION_NOTICE
+        return embed.add_field(name="Catégories", value=result.category_summary
+        ).add_field(name="ID", value=result.response_id)
 
     def _create_violation_report(self, message: discord.Message, result: ModerationResult) -> discord.Embed:
         """Crée le rapport de violation pour les modérateurs"""
-        category_field_value = "\n".join([
-            f"{CATEGORY_DESCRIPTIONS.get(category, category)}: {round(score, 3)*100}%" 
-            for category, score in result.violations
-        ])
-        self.logger.info(f"Violation report created for message {message.id}")
-        
-        return discord.Embed(
-            title="🚨 Violation détectée",
-            description=(
-                f"{message.author.mention} a été signalé pour violation par le système d'auto modération."
-            ),
-            color=discord.Color.red()
-        ).add_field(name="Auteur", value=f"{message.author.mention} ({message.author.id})"
-        ).add_field(name="Catégories", value=category_field_value
+        self.logger.debug("Violation report created for message %s", message.id)
+
+        embed = discord.Embed.from_dict(_VIOLATION_REPORT_TEMPLATE.copy())
+        embed.description = (
+            f"{message.author.mention} a été signalé pour violation par le système d'auto modération."
+        )
+        return embed.add_field(name="Auteur", value=f"{message.author.mention} ({message.author.id})"
+        ).add_field(name="Catégories", value=result.category_summary
         ).add_field(name="ID", value=result.response_id
         ).add_field(name="ID du message", value=message.id
-        ).add_field(name="Message", value=message.content
-        ).set_thumbnail(url="https://cdn3.emoji.gg/emojis/2731-certified-moderator.png")
+        ).add_field(name="Message", value=message.content)
 
     async def get_uptime(self) -> str:
         """Retourne le temps d'activité du bot"""
         if not self.uptime:
             return "Bot not fully initialized"
             
-        delta = datetime.now() - self.uptime
-        days, seconds = delta.days, delta.seconds
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-        self.logger.info(f"Uptime requested: {days}d, {hours}h, {minutes}m, {seconds}s")
+        elapsed = int(time.monotonic() - self.uptime)
+        days, rem = divmod(elapsed, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
+        self.logger.debug("Uptime requested: %dd, %dh, %dm, %ds", days, hours, minutes, seconds)
         return f"{days}d, {hours}h, {minutes}m, {seconds}s"
 
 async def main():
@@ -338,33 +593,33 @@ async def main():
     
     @bot.event
     async def on_ready():
-        bot.logger.info(f'Logged in as {bot.user.name}')
-        bot.logger.info(f"Connected to {len(bot.guilds)} servers")
-        bot.uptime = datetime.now()
+        bot.logger.info("Logged in as %s", bot.user.name)
+        bot.logger.info("Connected to %d servers", len(bot.guilds))
+        bot.uptime = time.monotonic()
+        await bot.db.preload_cache()
         try:
             synced = await bot.tree.sync()
-            bot.logger.info(f"Synced {len(synced)} slash commands")
+            bot.logger.info("Synced %d slash commands", len(synced))
         except Exception as e:
-            bot.logger.error(f"Failed to sync slash commands: {e}")
+            bot.logger.error("Failed to sync slash commands: %s", e)
 
     @bot.event
     async def on_message(message):
         if message.author == bot.user:
             return
             
-        bot.logger.info(f"Message from {message.author} ({message.author.id}): {message.content}")
+        bot.logger.debug("Message from %s (%s): %s", message.author, message.author.id, message.content)
         
-        result = await bot.check_message(message)
-        if result:
-            await bot.handle_violation(message, result)
-            
+        if bot.should_moderate(message):
+            bot.dispatch_moderation(message)
+
         await bot.process_commands(message)
 
     try:
-        bot.logger.info(f"Starting {bot.config.bot_name} v{bot.config.bot_version}")
+        bot.logger.info("Starting %s v%s", bot.config.bot_name, bot.config.bot_version)
         await bot.start(bot.config.discord_token)
     except Exception as e:
-        bot.logger.error(f"Failed to start bot: {e}")
+        bot.logger.error("Failed to start bot: %s", e)
         raise
 
 if __name__ == "__main__":